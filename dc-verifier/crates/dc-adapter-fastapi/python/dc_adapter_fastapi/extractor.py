@@ -60,7 +60,9 @@ class FastApiExtractor:
                     handler_file = None
                     handler_line = None
                     logger.warning(
-                        f"Не удалось получить информацию о файле для {route.endpoint}: {e}"
+                        "Не удалось получить информацию о файле для %s: %s",
+                        route.endpoint,
+                        e,
                     )
                 
                 # Сохраняем все HTTP методы без мутации route.methods
@@ -4,6 +4,7 @@ use dc_adapter_fastapi::FastApiCallGraphBuilder;
 use dc_core::call_graph::{CallEdge, CallGraph, CallNode};
 use dc_typescript::TypeScriptCallGraphBuilder;
 use indicatif::{ProgressBar, ProgressStyle};
+use std::fmt::Write;
 use std::fs;
 use std::path::PathBuf;
 
@@ -122,25 +123,23 @@ fn generate_dot(graph: &CallGraph, graph_name: &str) -> Result<String> {
     let mut dot = String::new();
 
     // DOT header
-    dot.push_str(&format!("digraph {} {{\n", graph_name.replace("-", "_")));
+    writeln!(dot, "digraph {} {{", graph_name.replace("-", "_"))?;
     dot.push_str("  rankdir=LR;\n");
     dot.push_str("  node [shape=box];\n\n");
 
-    // Create mapping of node indices to string identifiers
+    // Create mapping of node indices to sequential DOT node numbers
     let mut node_map = std::collections::HashMap::new();
-    let mut node_counter = 0;
 
     // Add nodes
     for node_idx in graph.node_indices() {
         if let Some(node) = graph.node_weight(node_idx) {
-            let node_id = format!("node_{}", node_counter);
-            node_map.insert(node_idx, node_id.clone());
-            node_counter += 1;
+            let node_number = node_map.len();
+            node_map.insert(node_idx, node_number);
 
             let label = format_node_label(node);
             // Escape special characters for DOT
             let escaped_label = escape_dot_string(&label);
-            dot.push_str(&format!("  {} [label=\"{}\"];\n", node_id, escaped_label));
+            writeln!(dot, "  node_{} [label=\"{}\"];", node_number, escaped_label)?;
         }
     }
 
@@ -149,17 +148,18 @@ fn generate_dot(graph: &CallGraph, graph_name: &str) -> Result<String> {
     // Add edges
     for edge_idx in graph.edge_indices() {
         if let Some((source, target)) = graph.edge_endpoints(edge_idx) {
-            if let (Some(source_id), Some(target_id), Some(edge)) = (
+            if let (Some(source_number), Some(target_number), Some(edge)) = (
                 node_map.get(&source),
                 node_map.get(&target),
                 graph.edge_weight(edge_idx),
             ) {
                 let edge_label = format_edge_label(edge);
                 let escaped_label = escape_dot_string(&edge_label);
-                dot.push_str(&format!(
-                    "  {} -> {} [label=\"{}\"];\n",
-                    source_id, target_id, escaped_label
-                ));
+                writeln!(
+                    dot,
+                    "  node_{} -> node_{} [label=\"{}\"];",
+                    source_number, target_number, escaped_label
+                )?;
             }
         }
     }
@@ -224,9 +224,16 @@ fn format_edge_label(edge: &CallEdge) -> String {
 
 /// Escapes special characters for DOT
 fn escape_dot_string(s: &str) -> String {
-    s.replace("\\", "\\\\")
-        .replace("\"", "\\\"")
-        .replace("\n", "\\n")
-        .replace("\r", "\\r")
-        .replace("\t", "\\t")
+    let mut escaped = String::with_capacity(s.len());
+    for ch in s.chars() {
+        match ch {
+            '\\' => escaped.push_str("\\\\"),
+            '"' => escaped.push_str("\\\""),
+            '\n' => escaped.push_str("\\n"),
+            '\r' => escaped.push_str("\\r"),
+            '\t' => escaped.push_str("\\t"),
+            _ => escaped.push(ch),
+        }
+    }
+    escaped
 }
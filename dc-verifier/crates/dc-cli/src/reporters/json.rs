@@ -1,6 +1,7 @@
 use anyhow::Result;
-use dc_core::models::DataChain;
-use std::fs;
+use dc_core::models::{DataChain, Severity};
+use std::fs::File;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 /// JSON report generator
@@ -9,25 +10,31 @@ pub struct JsonReporter;
 impl JsonReporter {
     /// Generates a JSON report
     pub fn generate(&self, chains: &[DataChain], output_path: &str) -> Result<()> {
+        // Count contract severities in a single pass
+        let mut critical_issues = 0usize;
+        let mut warnings = 0usize;
+        for contract in chains.iter().flat_map(|c| &c.contracts) {
+            match contract.severity {
+                Severity::Critical => critical_issues += 1,
+                Severity::Warning => warnings += 1,
+                Severity::Info => {}
+            }
+        }
+
         let report = serde_json::json!({
             "version": "1.0.0",
             "timestamp": chrono::Utc::now().to_rfc3339(),
             "summary": {
                 "total_chains": chains.len(),
-                "critical_issues": chains.iter()
-                    .flat_map(|c| &c.contracts)
-                    .filter(|c| c.severity == dc_core::models::Severity::Critical)
-                    .count(),
-                "warnings": chains.iter()
-                    .flat_map(|c| &c.contracts)
-                    .filter(|c| c.severity == dc_core::models::Severity::Warning)
-                    .count(),
+                "critical_issues": critical_issues,
+                "warnings": warnings,
             },
             "chains": chains,
         });
 
-        let json_string = serde_json::to_string_pretty(&report)?;
-        fs::write(Path::new(output_path), json_string)?;
+        let mut writer = BufWriter::new(File::create(Path::new(output_path))?);
+        serde_json::to_writer_pretty(&mut writer, &report)?;
+        writer.flush()?;
         Ok(())
     }
 }
@@ -1,5 +1,6 @@
 use anyhow::Result;
-use dc_core::models::DataChain;
+use dc_core::models::{DataChain, Severity};
+use std::fmt::Write;
 use std::fs;
 use std::path::Path;
 
@@ -13,52 +14,49 @@ impl MarkdownReporter {
 
         // Header
         report.push_str("# Data Chain Verification Report\n\n");
-        report.push_str(&format!(
-            "## Verification Date\n{}\n\n",
+        writeln!(
+            report,
+            "## Verification Date\n{}\n",
             chrono::Utc::now().format("%Y-%m-%d")
-        ));
+        )?;
 
-        // Statistics - count chains, not contracts
+        // Statistics - count chains, not contracts, in a single pass
         let total_chains = chains.len();
-        let chains_with_critical = chains
-            .iter()
-            .filter(|chain| {
-                chain
-                    .contracts
-                    .iter()
-                    .any(|c| c.severity == dc_core::models::Severity::Critical)
-            })
-            .count();
-        let chains_with_warnings = chains
-            .iter()
-            .filter(|chain| {
-                // Chains without Critical, but with at least one Warning
-                !chain
-                    .contracts
-                    .iter()
-                    .any(|c| c.severity == dc_core::models::Severity::Critical)
-                    && chain
-                        .contracts
-                        .iter()
-                        .any(|c| c.severity == dc_core::models::Severity::Warning)
-            })
-            .count();
+        let mut chains_with_critical = 0;
+        let mut chains_with_warnings = 0;
+        for chain in chains {
+            let mut has_warning = false;
+            let mut has_critical = false;
+            for contract in &chain.contracts {
+                match contract.severity {
+                    Severity::Critical => {
+                        has_critical = true;
+                        break;
+                    }
+                    Severity::Warning => has_warning = true,
+                    Severity::Info => {}
+                }
+            }
+            // Chains without Critical, but with at least one Warning
+            if has_critical {
+                chains_with_critical += 1;
+            } else if has_warning {
+                chains_with_warnings += 1;
+            }
+        }
         let valid_chains = total_chains - chains_with_critical - chains_with_warnings;
 
         report.push_str("## Verification Statistics\n");
-        report.push_str(&format!("- **Total Chains**: {}\n", total_chains));
-        report.push_str(&format!(
-            "- **Critical Issues**: {}\n",
-            chains_with_critical
-        ));
-        report.push_str(&format!("- **Warnings**: {}\n", chains_with_warnings));
-        report.push_str(&format!("- **Valid Chains**: {}\n\n", valid_chains));
+        writeln!(report, "- **Total Chains**: {}", total_chains)?;
+        writeln!(report, "- **Critical Issues**: {}", chains_with_critical)?;
+        writeln!(report, "- **Warnings**: {}", chains_with_warnings)?;
+        writeln!(report, "- **Valid Chains**: {}\n", valid_chains)?;
         report.push_str("---\n\n");
 
         // Chain details
         for (idx, chain) in chains.iter().enumerate() {
-            report.push_str(&format!("### Chain {}: {}\n\n", idx + 1, chain.name));
-            report.push_str(&format!("#### ID: {}\n\n", chain.id));
+            writeln!(report, "### Chain {}: {}\n", idx + 1, chain.name)?;
+            writeln!(report, "#### ID: {}\n", chain.id)?;
 
             // Data path
             report.push_str("#### Data Path:\n```\n");
@@ -74,25 +72,28 @@ impl MarkdownReporter {
             report.push_str("#### Checked Junctions:\n\n");
             for (i, contract) in chain.contracts.iter().enumerate() {
                 if contract.mismatches.is_empty() {
-                    report.push_str(&format!(
-                        "{}. ✅ **{} → {}**\n",
+                    writeln!(
+                        report,
+                        "{}. ✅ **{} → {}**",
                         i + 1,
                         contract.from_link_id,
                         contract.to_link_id
-                    ));
+                    )?;
                     report.push_str("   - ✅ **Корректно**: все поля совпадают\n\n");
                 } else {
-                    report.push_str(&format!(
-                        "{}. ⚠️ **{} → {}**\n",
+                    writeln!(
+                        report,
+                        "{}. ⚠️ **{} → {}**",
                         i + 1,
                         contract.from_link_id,
                         contract.to_link_id
-                    ));
+                    )?;
                     for mismatch in &contract.mismatches {
-                        report.push_str(&format!(
-                            "   - ⚠️ **{:?}**: {}\n",
+                        writeln!(
+                            report,
+                            "   - ⚠️ **{:?}**: {}",
                             mismatch.mismatch_type, mismatch.message
-                        ));
+                        )?;
                     }
                     report.push_str("\n");
                 }
@@ -519,10 +519,8 @@ impl TypeScriptCallGraphBuilder {
 
     fn find_ts_files(&self, dir: &PathBuf, files: &mut Vec<PathBuf>) -> Result<()> {
         if dir.is_file() {
-            if let Some(ext) = dir.extension() {
-                if ext == "ts" || ext == "tsx" {
-                    files.push(dir.clone());
-                }
+            if Self::is_ts_file(dir) {
+                files.push(dir.clone());
             }
             return Ok(());
         }
@@ -531,10 +529,30 @@ impl TypeScriptCallGraphBuilder {
             for entry in std::fs::read_dir(dir)? {
                 let entry = entry?;
                 let path = entry.path();
-                self.find_ts_files(&path, files)?;
+                // File type comes from the directory listing, so regular
+                // entries need no extra stat call; symlinks are resolved
+                // through the generic path
+                let file_type = entry.file_type()?;
+                if file_type.is_dir() {
+                    self.find_ts_files(&path, files)?;
+                } else if file_type.is_file() {
+                    if Self::is_ts_file(&path) {
+                        files.push(path);
+                    }
+                } else if file_type.is_symlink() {
+                    self.find_ts_files(&path, files)?;
+                }
             }
         }
 
         Ok(())
     }
+
+    /// Checks whether path has a TypeScript extension
+    fn is_ts_file(path: &Path) -> bool {
+        matches!(
+            path.extension().and_then(|ext| ext.to_str()),
+            Some("ts") | Some("tsx")
+        )
+    }
 }